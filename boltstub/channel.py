@@ -16,8 +16,9 @@
 # limitations under the License.
 
 
+from collections import deque
 from time import sleep
-from typing import Iterable
+from typing import AbstractSet
 
 from .bolt_protocol import get_bolt_protocol
 from .errors import ServerExit
@@ -26,8 +27,15 @@ from .parsing import ScriptFailure
 from .util import (
     EvalContext,
     hex_repr,
+    LazyHexRepr,
 )
 
+BOLT_MAGIC = b"\x60\x60\xb0\x17"
+
+
+def _no_log(*args, **kwargs):
+    pass
+
 
 class Channel:
     # This class is the glue between a stub script, the socket, and the bolt
@@ -36,22 +44,23 @@ class Channel:
     def __init__(self, wire, bolt_version, log_cb=None, handshake_data=None,
                  handshake_delay=None, eval_context=None):
         self.wire = wire
+        self.wire.set_nodelay()
         self.bolt_protocol = get_bolt_protocol(bolt_version)
+        protocol_version = self.bolt_protocol.protocol_version
+        self._version_response = bytes(
+            (0, 0, protocol_version[1], protocol_version[0])
+        )
         self.stream = PackStream(wire, self.bolt_protocol.packstream_version)
-        self.log = log_cb
+        self.log = log_cb or _no_log
         self.handshake_data = handshake_data
         self.handshake_delay = handshake_delay
-        self._buffered_msg = None
+        self._buffered_msgs = deque()
         self.eval_context = eval_context or EvalContext()
 
-    def _log(self, *args, **kwargs):
-        if self.log:
-            self.log(*args, **kwargs)
-
     def preamble(self):
         request = self.wire.read(4)
-        self._log("C: <MAGIC> %s", hex_repr(request))
-        if request != b"\x60\x60\xb0\x17":
+        self.log("C: <MAGIC> %s", LazyHexRepr(request))
+        if request != BOLT_MAGIC:
             raise ServerExit(
                 "Expected the magic header {}, received {}".format(
                     "6060B017", hex_repr(request)
@@ -60,7 +69,7 @@ class Channel:
 
     def version_handshake(self):
         request = self.wire.read(16)
-        self._log("C: <HANDSHAKE> %s", hex_repr(request))
+        self.log("C: <HANDSHAKE> %s", LazyHexRepr(request))
         if self.handshake_data is not None:
             response = self.handshake_data
         else:
@@ -71,9 +80,7 @@ class Channel:
                 self.bolt_protocol.decode_versions(request)
             )
             if supported_version in requested_versions:
-                response = bytes(
-                    (0, 0, supported_version[1], supported_version[0])
-                )
+                response = self._version_response
             else:
                 fallback_versions = (requested_versions
                                      & self.bolt_protocol.equivalent_versions)
@@ -82,8 +89,8 @@ class Channel:
                     response = bytes((0, 0, version[1], version[0]))
                 else:
                     try:
-                        self._log("S: <HANDSHAKE> %s",
-                                  hex_repr(b"\x00\x00\x00\x00"))
+                        self.log("S: <HANDSHAKE> %s",
+                                 LazyHexRepr(b"\x00\x00\x00\x00"))
                         self.wire.write(b"\x00\x00\x00\x00")
                         self.wire.send()
                     except OSError:
@@ -94,17 +101,17 @@ class Channel:
                                                            hex_repr(request))
                     )
         if self.handshake_delay:
-            self._log("S: <HANDSHAKE DELAY> %s", self.handshake_delay)
+            self.log("S: <HANDSHAKE DELAY> %s", self.handshake_delay)
             sleep(self.handshake_delay)
         self.wire.write(response)
         self.wire.send()
-        self._log("S: <HANDSHAKE> %s", hex_repr(response))
+        self.log("S: <HANDSHAKE> %s", LazyHexRepr(response))
 
     def match_client_line(self, client_line, msg):
         return client_line.match_message(msg.name, msg.fields)
 
     def send_raw(self, b):
-        self.log("%s", hex_repr(b))
+        self.log("%s", LazyHexRepr(b))
         self.wire.write(b)
         self.wire.send()
 
@@ -114,9 +121,15 @@ class Channel:
         self.stream.drain()
 
     def send_server_line(self, server_line):
-        self.log("%s", server_line)
-        server_line = self.bolt_protocol.translate_server_line(server_line)
-        self.stream.write_message(server_line)
+        self.send_server_lines((server_line,))
+
+    def send_server_lines(self, server_lines):
+        # write all messages before flushing them with a single send
+        for server_line in server_lines:
+            self.log("%s", server_line)
+            self.stream.write_message(
+                self.bolt_protocol.translate_server_line(server_line)
+            )
         self.stream.drain()
 
     def _consume(self):
@@ -125,29 +138,31 @@ class Channel:
         )
 
     def consume(self, line_no=None):
-        if self._buffered_msg is not None:
+        if self._buffered_msgs:
+            msg = self._buffered_msgs.popleft()
             if line_no:
-                self.log("(%3i) C: %s", line_no, self._buffered_msg)
+                self.log("(%3i) C: %s", line_no, msg)
             else:
-                self.log("(%3i) C: %s", self._buffered_msg)
-            msg = self._buffered_msg
-            self._buffered_msg = None
+                self.log("C: %s", msg)
             return msg
         return self._consume()
 
     def peek(self):
-        if self._buffered_msg is None:
-            self._buffered_msg = self._consume()
-        return self._buffered_msg
+        if not self._buffered_msgs:
+            self._buffered_msgs.append(self._consume())
+        return self._buffered_msgs[0]
 
     def auto_respond(self, msg):
         self.log("AUTO response:")
         self.send_struct(self.bolt_protocol.get_auto_response(msg))
 
-    def try_auto_consume(self, whitelist: Iterable[str]):
+    def try_auto_consume(self, whitelist: AbstractSet[str]):
+        if not whitelist:
+            # nothing could match => don't decode the next message for nothing
+            return False
         next_msg = self.peek()
         if next_msg.name in whitelist:
-            self._buffered_msg = None  # consume the message for real
+            self._buffered_msgs.popleft()  # consume the message for real
             self.log("C: %s", next_msg)
             self.auto_respond(next_msg)
             return True
@@ -163,7 +163,7 @@ class BangLine(Line):
                     "hex encoded bytes, whitespace is ignored (e.g. "
                     "'HANDSHAKE 00 FF 02 04 F0'"
                 )
-            obj._arg = bytearray(int(b, 16) for b in wrap(arg, 2))
+            obj._arg = bytearray.fromhex(arg)
         elif re.match(r"^HANDSHAKE_DELAY\s", obj.content):
             obj._type = BangLine.TYPE_HANDSHAKE_DELAY
             raw_arg = obj.content[16:].strip()
@@ -387,6 +387,7 @@ class AutoLine(ClientLine):
 
 class ServerLine(MessageLine):
     always_parse = False
+    raw_data = None
 
     def __new__(cls, *args, **kwargs):
         obj = super(ServerLine, cls).__new__(cls, *args, **kwargs)
@@ -418,7 +419,8 @@ class ServerLine(MessageLine):
                     raise LineError(obj, "NOOP takes no arguments")
             elif tag == "RAW":
                 try:
-                    bytearray(int(_, 16) for _ in wrap(args, 2))
+                    # parse once, send many times
+                    obj.raw_data = bytes(int(_, 16) for _ in wrap(args, 2))
                 except ValueError as e:
                     raise LineError(obj, "Invalid raw data") from e
             elif tag == "SLEEP":
@@ -449,7 +451,7 @@ class ServerLine(MessageLine):
             elif tag == "NOOP":
                 channel.send_raw(b"\x00\x00")
             elif tag == "RAW":
-                channel.send_raw(bytearray(int(_, 16) for _ in wrap(args, 2)))
+                channel.send_raw(self.raw_data)
             elif tag == "SLEEP":
                 sleep(float(args))
             else:
@@ -655,9 +657,15 @@ class ServerBlock(Block):
     def respond(self, channel):
         while not self.done(channel):
             line = self.lines[self.index]
-            if not line.try_run_command(channel):
-                channel.send_server_line(line)
-            self.index += 1
+            if line.try_run_command(channel):
+                self.index += 1
+                continue
+            # send consecutive messages with a single flush
+            end = self.index + 1
+            while end < len(self.lines) and not self.lines[end].is_command:
+                end += 1
+            channel.send_server_lines(self.lines[self.index:end])
+            self.index = end
 
     def reset(self):
         self.index = 0
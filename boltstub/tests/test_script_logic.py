@@ -51,6 +51,8 @@ class MockChannel:
         self.index = 0
         self.raw_buffer = bytearray()
         self.msg_buffer = []
+        # ("raw", bytes) or ("lines", [names]) in the order they were sent
+        self.send_log = []
         self.packstream_version = packstream_version
         self.eval_context = EvalContext()
         if self.packstream_version == 1:
@@ -76,6 +78,7 @@ class MockChannel:
 
     def send_raw(self, b):
         self.raw_buffer.extend(b)
+        self.send_log.append(("raw", bytes(b)))
 
     def send_struct(self, struct):
         self.msg_buffer.append(struct)
@@ -87,6 +90,13 @@ class MockChannel:
                                   packstream_version=self.packstream_version)
         self.msg_buffer.append(msg)
 
+    def send_server_lines(self, server_lines):
+        for server_line in server_lines:
+            self.send_server_line(server_line)
+        self.send_log.append(("lines", [
+            server_line.jolt_parsed[0] for server_line in server_lines
+        ]))
+
     def msg_buffer_names(self):
         return [msg.name for msg in self.msg_buffer]
 
@@ -928,6 +938,23 @@ class TestServerBlock:
         assert not multi_block.can_consume(multi_channel)
         assert not multi_block.try_consume(multi_channel)
 
+    def test_batches_messages_between_commands(self):
+        channel = channel_factory(["NOMATCH"])
+        block = ServerBlock([  # noqa: PAR103
+            ServerLine(1, "S: SMSG1", "SMSG1"),
+            ServerLine(2, "S: <RAW> FF", "<RAW> FF"),
+            ServerLine(3, "S: SMSG2", "SMSG2"),
+            ServerLine(4, "S: SMSG3", "SMSG3"),
+        ], 1)
+        block.init(channel)
+        assert block.done(channel)
+        assert channel.send_log == [
+            ("lines", ["SMSG1"]),
+            ("raw", b"\xff"),
+            ("lines", ["SMSG2", "SMSG3"]),
+        ]
+        assert channel.msg_buffer_names() == ["SMSG1", "SMSG2", "SMSG3"]
+
 
 class _TestRepeatBlock:
     must_run_once = None
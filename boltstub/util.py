@@ -52,6 +52,23 @@ def hex_repr(b, upper=True):
         return " ".join("{:02x}".format(x) for x in b)
 
 
+class LazyHexRepr:
+    """Defer :func:`hex_repr` until the wrapped bytes get formatted.
+
+    Meant as argument for log calls so that disabled log levels don't pay for
+    the formatting.
+    """
+
+    __slots__ = ("_b", "_upper")
+
+    def __init__(self, b, upper=True):
+        self._b = b
+        self._upper = upper
+
+    def __str__(self):
+        return hex_repr(self._b, upper=self._upper)
+
+
 def recursive_subclasses(cls):
     for s_cls in cls.__subclasses__():
         yield s_cls
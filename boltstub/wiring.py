@@ -32,6 +32,8 @@ from socket import (
     AF_INET,
     AF_INET6,
     getservbyname,
+    IPPROTO_TCP,
+    TCP_NODELAY,
     timeout,
 )
 
@@ -268,6 +270,20 @@ class Wire(object):
                 "Unable to establish secure connection with remote peer"
             )
 
+    def set_nodelay(self):
+        """Disable Nagle's algorithm on the underlying socket.
+
+        The stub server sends many small messages (handshake responses,
+        single Bolt messages) and waits for the peer's reply after each one.
+        Without this, every such write may be held back until the previous
+        segment got acknowledged.
+        """
+        try:
+            self._socket.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+        except OSError:
+            # not a TCP socket (e.g., UNIX domain socket)
+            pass
+
     def read(self, n):
         """Read bytes from the network."""
         while len(self._input) < n:
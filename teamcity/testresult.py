@@ -2,36 +2,40 @@ import unittest
 
 from .env import in_teamcity
 
+_ESCAPE_TABLE = str.maketrans({
+    "|": "||",
+    "\n": "|n",
+    "\r": "|r",
+    "'": "|'",
+    "[": "|[",
+    "]": "|]",
+})
+
 
 def escape(s):
-    s = s.replace("|", "||")
-    s = s.replace("\n", "|n")
-    s = s.replace("\r", "|r")
-    s = s.replace("'", "|'")
-    s = s.replace("[", "|[")
-    s = s.replace("]", "|]")
-    return s
+    return s.translate(_ESCAPE_TABLE)
 
 
 def test_kit_basic_test_result(name):
+    # the suite name and the environment are fixed for the lifetime of the
+    # result class => render the suite messages only once
+    if in_teamcity:
+        start_line = "##teamcity[testSuiteStarted name='%s']" % escape(name)
+        stop_line = "##teamcity[testSuiteFinished name='%s']" % escape(name)
+    else:
+        start_line = ">>> Start test suite: %s" % name
+        stop_line = ">>> End test suite: %s" % name
+
     class TestKitBasicTestResult(unittest.TextTestResult):
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
 
         def startTestRun(self):  # noqa: N802
-            if in_teamcity:
-                self.stream.writeln("##teamcity[testSuiteStarted name='%s']"
-                                    % escape(name))
-            else:
-                self.stream.writeln(">>> Start test suite: %s" % name)
+            self.stream.writeln(start_line)
             self.stream.flush()
 
         def stopTestRun(self):  # noqa: N802
-            if in_teamcity:
-                self.stream.writeln("##teamcity[testSuiteFinished name='%s']"
-                                    % escape(name))
-            else:
-                self.stream.writeln(">>> End test suite: %s" % name)
+            self.stream.writeln(stop_line)
             self.stream.flush()
 
     return TestKitBasicTestResult
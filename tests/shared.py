@@ -25,7 +25,11 @@ import ifaddr
 from nutkit import protocol
 from nutkit.backend import Backend
 
+_TEST_ID_PREFIX_RE = re.compile(r"^([^\.]+\.)*?tests\.")
+_BOLT_VERSION_RE = re.compile(r"\D*(\d+)(?:\D+(\d+))?")
 
+
+@functools.lru_cache(maxsize=1)
 def get_backend_host_and_port():
     host = os.environ.get("TEST_BACKEND_HOST", "127.0.0.1")
     port = int(os.environ.get("TEST_BACKEND_PORT", 9876))
@@ -100,26 +104,22 @@ def driver_feature(*features):
     return driver_feature_decorator
 
 
-class MemoizedSupplier:
-    """Memoize the function it annotates.
+_driver_features = None
 
-    This way the decorated function will always return the
-    same value of the first interaction independent of the
-    supplied params.
-    """
 
-    def __init__(self, func):
-        self._func = func
-        self._memo = None
+def get_driver_features(backend):
+    """Return the features supported by the driver under test.
 
-    def __call__(self, *args, **kwargs):
-        if self._memo is None:
-            self._memo = self._func(*args, **kwargs)
-        return self._memo
+    The features are only fetched on the first call. Later calls return
+    the same set independent of the supplied backend.
+    """
+    global _driver_features
+    if _driver_features is None:
+        _driver_features = _fetch_driver_features(backend)
+    return _driver_features
 
 
-@MemoizedSupplier
-def get_driver_features(backend):
+def _fetch_driver_features(backend):
     try:
         response = backend.send_and_receive(protocol.GetFeatures())
         if not isinstance(response, protocol.FeatureList):
@@ -140,18 +140,24 @@ def get_driver_features(backend):
         return set()
 
 
+@functools.lru_cache(maxsize=1)
 def get_driver_name():
     return os.environ["TEST_DRIVER_NAME"]
 
 
+@functools.lru_cache(maxsize=None)
+def _get_scripts_dir(cls):
+    return os.path.join(os.path.dirname(inspect.getfile(cls)), "scripts")
+
+
 class TestkitTestCase(unittest.TestCase):
 
     required_features = None
 
     def setUp(self):
         super().setUp()
-        self._testkit_test_name = id_ = re.sub(
-            r"^([^\.]+\.)*?tests\.", "", self.id()
+        self._testkit_test_name = id_ = _TEST_ID_PREFIX_RE.sub(
+            "", self.id()
         )
         self._check_subtests = False
         self._backend = new_backend()
@@ -183,7 +189,7 @@ class TestkitTestCase(unittest.TestCase):
         if isinstance(version, protocol.Feature):
             return self.driver_supports_features(version)
         elif isinstance(version, str):
-            m = re.match(r"\D*(\d+)(?:\D+(\d+))?", version)
+            m = _BOLT_VERSION_RE.match(version)
             if not m:
                 raise ValueError("Invalid bolt version specification")
             version = tuple(map(int, m.groups("0")))
@@ -216,8 +222,7 @@ class TestkitTestCase(unittest.TestCase):
         )
 
     def script_path(self, *path):
-        base_path = os.path.dirname(inspect.getfile(self.__class__))
-        return os.path.join(base_path, "scripts", *path)
+        return os.path.join(_get_scripts_dir(self.__class__), *path)
 
     @contextmanager
     def subTest(self, **params):  # noqa: N802
@@ -4,7 +4,12 @@ from tests.shared import (
     driver_feature,
     TestkitTestCase,
 )
-from tests.stub.shared import StubServer
+from tests.stub.shared import (
+    done_all,
+    reset_all,
+    start_all,
+    StubServer,
+)
 
 
 class TestHomeDb(TestkitTestCase):
@@ -19,23 +24,23 @@ class TestHomeDb(TestkitTestCase):
         self._auth_token = types.AuthorizationToken("basic", principal="p",
                                                     credentials="c")
         self._uri = "neo4j://%s" % self._router.address
+        self._router_vars = {"#HOST#": self._router.host}
 
     def tearDown(self):
-        self._reader1.reset()
-        self._reader2.reset()
-        self._router.reset()
+        reset_all(self._reader1, self._reader2, self._router)
         super().tearDown()
 
+    def _start_servers(self, *specs):
+        start_all(*((server, self.script_path(script_fn), vars_)
+                    for server, script_fn, vars_ in specs))
+
     @driver_feature(types.Feature.IMPERSONATION)
     def test_should_resolve_db_per_session_session_run(self):
         def _test():
-            self._router.start(
-                path=self.script_path("router_change_homedb.script"),
-                vars_={"#HOST#": self._router.host}
-            )
-
-            self._reader1.start(
-                path=self.script_path("reader_change_homedb.script")
+            self._start_servers(
+                (self._router, "router_change_homedb.script",
+                 self._router_vars),
+                (self._reader1, "reader_change_homedb.script", None),
             )
 
             driver = Driver(self._backend, self._uri, self._auth_token)
@@ -57,25 +62,20 @@ class TestHomeDb(TestkitTestCase):
 
             driver.close()
 
-            self._router.done()
-            self._reader1.done()
+            done_all(self._router, self._reader1)
 
         for parallel_sessions in (True, False):
             with self.subTest(parallel_sessions=parallel_sessions):
                 _test()
-            self._router.reset()
-            self._reader1.reset()
+            reset_all(self._router, self._reader1)
 
     @driver_feature(types.Feature.IMPERSONATION)
     def test_should_resolve_db_per_session_tx_run(self):
         def _test():
-            self._router.start(
-                path=self.script_path("router_change_homedb.script"),
-                vars_={"#HOST#": self._router.host}
-            )
-
-            self._reader1.start(
-                path=self.script_path("reader_tx_change_homedb.script")
+            self._start_servers(
+                (self._router, "router_change_homedb.script",
+                 self._router_vars),
+                (self._reader1, "reader_tx_change_homedb.script", None),
             )
 
             driver = Driver(self._backend, self._uri, self._auth_token)
@@ -101,14 +101,12 @@ class TestHomeDb(TestkitTestCase):
 
             driver.close()
 
-            self._router.done()
-            self._reader1.done()
+            done_all(self._router, self._reader1)
 
         for parallel_sessions in (True, False):
             with self.subTest(parallel_sessions=parallel_sessions):
                 _test()
-            self._router.reset()
-            self._reader1.reset()
+            reset_all(self._router, self._reader1)
 
     @driver_feature(types.Feature.IMPERSONATION)
     def test_should_resolve_db_per_session_tx_func_run(self):
@@ -117,13 +115,10 @@ class TestHomeDb(TestkitTestCase):
                 result = tx.run(query)
                 result.consume()
 
-            self._router.start(
-                path=self.script_path("router_change_homedb.script"),
-                vars_={"#HOST#": self._router.host}
-            )
-
-            self._reader1.start(
-                path=self.script_path("reader_tx_change_homedb.script")
+            self._start_servers(
+                (self._router, "router_change_homedb.script",
+                 self._router_vars),
+                (self._reader1, "reader_tx_change_homedb.script", None),
             )
 
             driver = Driver(self._backend, self._uri, self._auth_token)
@@ -145,14 +140,12 @@ class TestHomeDb(TestkitTestCase):
 
             driver.close()
 
-            self._router.done()
-            self._reader1.done()
+            done_all(self._router, self._reader1)
 
         for parallel_sessions in (True, False):
             with self.subTest(parallel_sessions=parallel_sessions):
                 _test()
-            self._router.reset()
-            self._reader1.reset()
+            reset_all(self._router, self._reader1)
 
     @driver_feature(types.Feature.IMPERSONATION)
     def test_session_should_cache_home_db_despite_new_rt(self):
@@ -165,14 +158,11 @@ class TestHomeDb(TestkitTestCase):
                 with self.assertRaises(types.DriverError) as exc:
                     res = tx.run("RETURN 1")
                     return res.next()
-                self._router.done()
-                self._reader1.done()
-                self._router.start(
-                    path=self.script_path("router_explicit_homedb.script"),
-                    vars_={"#HOST#": self._router.host}
-                )
-                self._reader2.start(
-                    path=self.script_path("reader_tx_homedb.script")
+                done_all(self._router, self._reader1)
+                self._start_servers(
+                    (self._router, "router_explicit_homedb.script",
+                     self._router_vars),
+                    (self._reader2, "reader_tx_homedb.script", None),
                 )
                 raise exc.exception
             else:
@@ -181,12 +171,9 @@ class TestHomeDb(TestkitTestCase):
 
         driver = Driver(self._backend, self._uri, self._auth_token)
 
-        self._router.start(
-            path=self.script_path("router_homedb.script"),
-            vars_={"#HOST#": self._router.host}
-        )
-        self._reader1.start(
-            path=self.script_path("reader_tx_exits.script")
+        self._start_servers(
+            (self._router, "router_homedb.script", self._router_vars),
+            (self._reader1, "reader_tx_exits.script", None),
         )
 
         session = driver.session("r", impersonated_user="the-imposter")
@@ -195,6 +182,5 @@ class TestHomeDb(TestkitTestCase):
 
         driver.close()
 
-        self._router.done()
-        self._reader2.done()
+        done_all(self._router, self._reader2)
         self.assertEqual(i, 2)
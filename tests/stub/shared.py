@@ -4,6 +4,7 @@ Uses environment variables for configuration:
 """
 
 import errno
+import functools
 import os
 import platform
 import re
@@ -12,12 +13,18 @@ import subprocess
 import sys
 import tempfile
 import time
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    wait,
+)
 from queue import (
     Empty,
     Queue,
 )
-from textwrap import wrap
-from threading import Thread
+from threading import (
+    Lock,
+    Thread,
+)
 
 if platform.system() == "Windows":
     INTERRUPT = signal.CTRL_BREAK_EVENT
@@ -28,6 +35,13 @@ else:
     INTERRUPT_EXIT_CODE = -signal.SIGINT
     POPEN_EXTRA_KWARGS = {}
 
+# keeps the output of stub servers dumped from different threads apart
+_dump_lock = Lock()
+# Starting and stopping stub servers is mostly waiting for their processes.
+# This pool is shared to do that for several servers at once without spawning
+# new threads every time.
+_executor = ThreadPoolExecutor(thread_name_prefix="stub_server")
+
 
 class StubServerError(Exception):
     pass
@@ -47,6 +61,14 @@ def _poll_pipe(pipe, queue):
     pipe.close()
 
 
+@functools.lru_cache(maxsize=64)
+def _read_script(path):
+    # scripts don't change during a test run, but many of them get started
+    # over and over again with different vars_
+    with open(path, "r") as f:
+        return f.read()
+
+
 class StubServer:
     def __init__(self, port):
         self.host = os.environ.get("TEST_STUB_HOST", "127.0.0.1")
@@ -80,14 +102,14 @@ class StubServer:
             if path:
                 self._last_rewritten_path = path
                 script_fn = os.path.basename(path)
-                with open(path, "r") as f:
-                    script = f.read()
+                script = _read_script(path)
             for v in vars_:
                 script = script.replace(v, str(vars_[v]))
         if script:
-            tempdir = tempfile.gettempdir()
-            path = os.path.join(tempdir, script_fn)
-            with open(path, "w") as f:
+            # unique file name so servers started concurrently with the same
+            # script don't overwrite or delete each other's files
+            fd, path = tempfile.mkstemp(suffix="_" + script_fn)
+            with os.fdopen(fd, "w") as f:
                 f.write(script)
                 f.flush()
                 os.fsync(f)
@@ -162,22 +184,24 @@ class StubServer:
                 break
 
     def _dump(self):
-        if self._last_rewritten_path:
-            print(f"Original stub script file: {self._last_rewritten_path}")
-        self._read_pipes()
-        sys.stdout.flush()
-        print(">>>> Captured stub server %s stdout" % self.address)
-        for line in self._stdout_lines:
-            print(line, end="")
-        print("<<<< Captured stub server %s stdout" % self.address)
+        with _dump_lock:
+            if self._last_rewritten_path:
+                print("Original stub script file: "
+                      f"{self._last_rewritten_path}")
+            self._read_pipes()
+            sys.stdout.flush()
+            print(">>>> Captured stub server %s stdout" % self.address)
+            for line in self._stdout_lines:
+                print(line, end="")
+            print("<<<< Captured stub server %s stdout" % self.address)
 
-        print(">>>> Captured stub server %s stderr" % self.address)
-        for line in self._stderr_lines:
-            print(line, end="")
-        print("<<<< Captured stub server %s stderr" % self.address)
+            print(">>>> Captured stub server %s stderr" % self.address)
+            for line in self._stderr_lines:
+                print(line, end="")
+            print("<<<< Captured stub server %s stderr" % self.address)
 
-        # self._close_pipes()
-        sys.stdout.flush()
+            # self._close_pipes()
+            sys.stdout.flush()
 
     def _kill(self):
         self._process.kill()
@@ -305,8 +329,7 @@ class StubServer:
             return 0,
         assert len(handshakes) == 1
         handshake = handshakes[0][len(handshake_prefix):]
-        handshake = re.sub(r"\s", "", handshake)
-        version = list(int(b, 16) for b in wrap(handshake, 2))
+        version = list(bytes.fromhex(handshake))
         while len(version) > 1 and not version[0]:
             version.pop(0)
         version.reverse()
@@ -409,6 +432,42 @@ class StubServer:
         return "\n".join(self._stdout_lines), "\n".join(self._stderr_lines)
 
 
+def _wait_all(futures):
+    # let all calls finish before raising so no server is left half-way
+    # through starting or stopping
+    wait(futures)
+    for future in futures:
+        future.result()
+
+
+def start_all(*specs):
+    """Start multiple stub servers concurrently.
+
+    :param specs: tuples of (server, path, vars_) passed on to
+        :meth:`StubServer.start`.
+    """
+    _wait_all([_executor.submit(server.start, path=path, vars_=vars_)
+               for server, path, vars_ in specs])
+
+
+def done_all(*servers):
+    """Call :meth:`StubServer.done` on multiple stub servers concurrently.
+
+    If any server didn't finish cleanly, the error of the first such server
+    (in argument order) is raised.
+    """
+    _wait_all([_executor.submit(server.done) for server in servers])
+
+
+def reset_all(*servers):
+    """Reset multiple stub servers concurrently.
+
+    See :meth:`StubServer.reset`. Each reset may wait for the server to shut
+    down gracefully, so resetting them one after another adds up.
+    """
+    _wait_all([_executor.submit(server.reset) for server in servers])
+
+
 scripts_path = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), "scripts"
 )
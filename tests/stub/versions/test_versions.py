@@ -19,9 +19,14 @@ class TestProtocolVersions(TestkitTestCase):
     bolt protocol version.
     """
 
+    # newest first
+    _VERSIONS = "5x2", "5x1", "5x0", "4x4", "4x3", "4x2", "4x1", "3"
+    _AUTH = types.AuthorizationToken("basic", principal="", credentials="")
+
     def setUp(self):
         super().setUp()
         self._server = StubServer(9001)
+        self._uri = "bolt://%s" % self._server.address
 
     def tearDown(self):
         self._server.done()
@@ -29,10 +34,7 @@ class TestProtocolVersions(TestkitTestCase):
 
     @contextmanager
     def _get_session(self, script_path, vars_=None):
-        uri = "bolt://%s" % self._server.address
-        driver = Driver(self._backend, uri,
-                        types.AuthorizationToken("basic", principal="",
-                                                 credentials=""))
+        driver = Driver(self._backend, self._uri, self._AUTH)
         self._server.start(path=script_path, vars_=vars_)
         session = driver.session("w", fetch_size=1000)
         try:
@@ -146,14 +148,14 @@ class TestProtocolVersions(TestkitTestCase):
         self._run("5x2")
 
     def test_server_version(self):
-        for version in ("5x2", "5x1", "5x0", "4x4", "4x3", "4x2", "4x1", "3"):
+        for version in self._VERSIONS:
             if not self.driver_supports_bolt(version):
                 continue
             with self.subTest(version=version):
                 self._run(version, check_version=True)
 
     def test_server_agent(self):
-        for version in ("5x2", "5x1", "5x0", "4x4", "4x3", "4x2", "4x1", "3"):
+        for version in self._VERSIONS:
             for agent, reject in (
                 ("Neo4j/4.3.0", False),
                 ("Neo4j/4.1.0", False),
@@ -185,7 +187,7 @@ class TestProtocolVersions(TestkitTestCase):
         # TODO: remove block when all drivers support the address field
         if get_driver_name() in ["javascript", "dotnet"]:
             self.skipTest("Backend doesn't support server address in summary")
-        for version in ("5x2", "5x1", "5x0", "4x4", "4x3", "4x2", "4x1", "3"):
+        for version in self._VERSIONS:
             if not self.driver_supports_bolt(version):
                 continue
             with self.subTest(version=version):
@@ -286,10 +288,7 @@ class TestProtocolVersions(TestkitTestCase):
     def _test_should_reject_server_using_verify_connectivity(
         self, version, script
     ):
-        uri = "bolt://%s" % self._server.address
-        driver = Driver(self._backend, uri,
-                        types.AuthorizationToken("basic", principal="",
-                                                 credentials=""))
+        driver = Driver(self._backend, self._uri, self._AUTH)
         script_path = self.script_path(script)
         variables = {
             "#VERSION#": version,